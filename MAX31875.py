@@ -3,12 +3,69 @@ A driver for temperature sensor MAX31875
 by Hui 20210722
 """
 
-from smbus2 import SMBus
+import time
+
+from smbus2 import SMBus, i2c_msg
 
 __author__ = "Hui"
 __version__ = "1.0.0"
 
+# default for configure() arguments that are not given.
+_KEEP = object()
+
+try:
+    import crcmod
+    # CRC-8 with polynomial x^8 + x^2 + x + 1, used by SMBus PEC.
+    _crc8 = crcmod.mkCrcFun(0x107, initCrc=0, rev=False)
+except ImportError:
+    _CRC8_TABLE = b'\x00\x07\x0e\t\x1c\x1b\x12\x158?61$#*-pw~ylkbeHOFATSZ]\xe0\xe7\xee\xe9\xfc\xfb\xf2\xf5\xd8\xdf\xd6\xd1\xc4\xc3\xca\xcd\x90\x97\x9e\x99\x8c\x8b\x82\x85\xa8\xaf\xa6\xa1\xb4\xb3\xba\xbd\xc7\xc0\xc9\xce\xdb\xdc\xd5\xd2\xff\xf8\xf1\xf6\xe3\xe4\xed\xea\xb7\xb0\xb9\xbe\xab\xac\xa5\xa2\x8f\x88\x81\x86\x93\x94\x9d\x9a\' ).;<52\x1f\x18\x11\x16\x03\x04\r\nWPY^KLEBohafst}z\x89\x8e\x87\x80\x95\x92\x9b\x9c\xb1\xb6\xbf\xb8\xad\xaa\xa3\xa4\xf9\xfe\xf7\xf0\xe5\xe2\xeb\xec\xc1\xc6\xcf\xc8\xdd\xda\xd3\xd4ing`ur{|QV_XMJCD\x19\x1e\x17\x10\x05\x02\x0b\x0c!&/(=:34NI@GRU\\[vqx\x7fjmdc>907"%,+\x06\x01\x08\x0f\x1a\x1d\x14\x13\xae\xa9\xa0\xa7\xb2\xb5\xbc\xbb\x96\x91\x98\x9f\x8a\x8d\x84\x83\xde\xd9\xd0\xd7\xc2\xc5\xcc\xcb\xe6\xe1\xe8\xef\xfa\xfd\xf4\xf3'
+
+    def _crc8(data):
+        _sum = 0
+        for byte in data:
+            _sum = _CRC8_TABLE[_sum ^ byte]
+        return _sum
+
+
+def _packField(buf, name, spec, value):
+    """
+    validate value and pack it into the config bytes in buf.
+    spec is the field's entry in MAX31875._FIELD_SPECS.
+    """
+    byte_idx, shift, mask, keep, valid = spec
+    if value not in valid:
+        raise ValueError(f"Invalid {name}")
+    buf[byte_idx] = (buf[byte_idx] & keep) | (value << shift)
+
+
+def _configFields(cls):
+    """
+    build cls._FIELD_SPECS from cls._FIELDS and add a property for each field.
+    a spec is (byte index, bit shift, bit mask, keep mask, valid values).
+    the getter reads the current config, the setter updates configBuf.
+    fields the class defines itself (PEC) keep their own property,
+    which uses the same spec.
+    """
+    specs = {}
+    for name, (byte_idx, shift, mask) in cls._FIELDS.items():
+        spec = (byte_idx, shift, mask, ~(mask << shift) & 0xFF,
+                tuple(range(mask + 1)))
+        specs[name] = spec
+        if name in cls.__dict__:
+            continue
+
+        def fget(self, byte_idx=byte_idx, shift=shift, mask=mask):
+            return self._read_field(byte_idx, shift, mask)
+
+        def fset(self, value, name=name, spec=spec):
+            _packField(self.configBuf, name, spec, value)
+
+        setattr(cls, name, property(fget, fset, doc=cls._FIELD_DOCS[name]))
+    cls._FIELD_SPECS = specs
+    return cls
+
 
+@_configFields
 class MAX31875:
     """
     I2C temperature sensor MAX31875
@@ -16,200 +73,178 @@ class MAX31875:
     The confgBuf is initialized with POR state on datasheet.
     Always call writeConfig after made any changes to configurations.
     """
-    def __init__(self, part_number=7) -> None:
-        """
-        part_number: 0 - 7
-        corresponds to part number MAX31875R0 - MAX31875R7.
-        corresponds to 0x48 - 0x4F on the I2C address.
-        """
-        self.bus = SMBus(1)
-        self.addr = 0x48 + part_number
-        self.configBuf = [0x00, 0x40]
-        self.config = [0x00, 0x40]
-
-    @property
-    def format(self):
-        """
-        return current temperature format,
-        0: normal format
-        1: extended format
-        """
-        return (self.config[1] >> 7)
-
-    @format.setter
-    def format(self, fmt):
-        """
-        set the temperature format, can be 0 or 1.
+    __slots__ = ('bus', 'addr', 'configBuf', 'config', '_pec_enabled',
+                 '_addr_w', '_addr_r', '_temp_cache', '_refresh_period',
+                 '_refresh_override')
+
+    # configuration fields: name: (config byte index, bit shift, bit mask)
+    # a property is generated for each field by _configFields,
+    # except PEC, whose property is defined below.
+    _FIELDS = {
+        'format': (1, 7, 1),
+        'PEC': (1, 3, 1),
+        'resolution': (1, 5, 3),
+        'conversionRate': (1, 1, 3),
+        'timeOut': (1, 4, 1),
+        'faultQueue': (0, 3, 3),
+        'shutDown': (0, 1, 1),
+        'compInt': (0, 2, 1),
+    }
+    _FIELD_DOCS = {
+        'format': """
+        temperature format,
         0: normal format (default)
         1: extended format
-        """
-        if fmt not in (0, 1):
-            raise ValueError("Invalid format")
-        self.configBuf[1] = (self.configBuf[1] & 0x7F) | (fmt << 7)
-
-    @property
-    def PEC(self):
-        """
-        return current packet error checking (PEC) setting
-        0: PEC is disabled
-        1: PEC is enabled
-        """
-        return (self.config[1] >> 3) & 1
-
-    @PEC.setter
-    def PEC(self, PEC):
-        """
-        set the packet error checking (PEC) setting
-        0: PEC is disabled
-        1: PEC is enabled
-        """
-        if PEC not in (0, 1):
-            raise ValueError("Invalid PEC")
-        self.configBuf[1] = (self.configBuf[1] & 0xF7) | (PEC << 3)
-        if PEC:
-            # if enabling PEC, then set the current config state to PEC enabled.
-            # otherwise, the config write will fail.
-            self.config[1] = (self.config[1] & 0xF7) | (PEC << 3)
-
-    @property
-    def resolution(self):
-        """
-        return current temperature resolution,
-        0: 8-bit resolution
-        1: 9-bit resolution
-        2: 10-bit resolution
-        3: 12-bit resolution
-        """
-        return (self.config[1] >> 5) & 3
-
-    @resolution.setter
-    def resolution(self, res):
-        """
-        set the resolution.
+        """,
+        'resolution': """
+        temperature resolution,
         0: 8-bit resolution
         1: 9-bit resolution
         2: 10-bit resolution
         3: 12-bit resolution
-        """
-        if res not in (0, 1, 2, 3):
-            raise ValueError("Invalid resolution")
-        self.configBuf[1] = (self.configBuf[1] & 0x9F) | (res << 5)
-
-    @property
-    def conversionRate(self):
-        """
-        return current conversion rate.
-        0: 0.25 conversion/second
-        1: 1 conversion/second
-        2: 4 conversions/second
-        3: 8 conversions/second
-        """
-        return (self.config[1] >> 1) & 3
-
-    @conversionRate.setter
-    def conversionRate(self, rate):
-        """
-        set the conversion rate.
+        """,
+        'conversionRate': """
+        conversion rate.
         0: 0.25 conversion/second
         1: 1 conversion/second
         2: 4 conversions/second
         3: 8 conversions/second
-        """
-        if rate not in (0, 1, 2, 3):
-            raise ValueError("Invalid conversion rate")
-        self.configBuf[1] = (self.configBuf[1] & 0xF9) | (rate << 1)
-
-    @property
-    def timeOut(self):
-        """
-        return the current time out setting
-        Bus timeout resets I2C interface when SCL is low for 
+        """,
+        'timeOut': """
+        time out setting
+        Bus timeout resets I2C interface when SCL is low for
         more than 30ms.
-        0: enable time out on bus.         
-        1: disable time out on bus.
-        """
-        return (self.config[1] >> 4) & 1
-
-    @timeOut.setter
-    def timeOut(self, t):
-        """
-        set the time out.
         0: enable time out on bus.
         1: disable time out on bus.
-        """
-        if t not in (0, 1):
-            raise ValueError("Invalid time out")
-        self.configBuf[1] = (self.configBuf[1] & 0xEF) | (t << 4)
-
-    @property
-    def faultQueue(self):
-        """
-        return the fault queue settings.
-        Fault queue select how many consecutive overtemperature 
-        faults must occur before an overtemperature falut is indicated in 
+        """,
+        'faultQueue': """
+        fault queue settings.
+        Fault queue select how many consecutive overtemperature
+        faults must occur before an overtemperature falut is indicated in
         the overtemperature status bit.
         0: 1 fault
         1: 2 faults
         2: 4 faults
         3: 6 faults
+        """,
+        'shutDown': """
+        shutdown mode setting
+        shutdown mode reduce supply current to 1uA or less.
+        continuous temperature conversion is stopped.
+        0: continuous conversion mode
+        1: shut down mode
+        """,
+        'compInt': """
+        comparator interrupt setting.
+        the mode determine the behavior of overtemperature status bit operation.
+        0: comparator mode
+        1: interrupt mode
+        """,
+    }
+    # seconds between conversions for each conversionRate setting.
+    _REFRESH_PERIODS = (4.0, 1.0, 0.25, 0.125)
+    # one-shot bit in the upper config byte, cleared by the sensor
+    # when the conversion is done.
+    _ONESHOT = 0x01
+    # shutdown bit in the upper config byte.
+    _SHUTDOWN = 1 << _FIELDS['shutDown'][1]
+    # seconds between one-shot status polls, and before giving up.
+    _ONESHOT_POLL = 0.008
+    _ONESHOT_TIMEOUT = 0.5
+    # SMBus(1) handle shared by all sensors that are not given a bus.
+    _shared_bus = None
+
+    def __init__(self, part_number=7, bus=None) -> None:
         """
-        return (self.config[0] >> 3) & 3
+        part_number: 0 - 7
+        corresponds to part number MAX31875R0 - MAX31875R7.
+        corresponds to 0x48 - 0x4F on the I2C address.
+        bus: optional SMBus object to use.
+        if not given, all sensors share one SMBus(1) handle.
+        """
+        if bus is None:
+            if MAX31875._shared_bus is None:
+                MAX31875._shared_bus = SMBus(1)
+            bus = MAX31875._shared_bus
+        self.bus = bus
+        self.addr = 0x48 + part_number
+        # address bytes as they appear on the bus, used in the PEC CRC.
+        self._addr_w = self.addr << 1
+        self._addr_r = (self.addr << 1) | 1
+        self.configBuf = bytearray((0x00, 0x40))
+        self.config = bytearray((0x00, 0x40))
+        # PEC bit of self.config, cached for the read/write hot path.
+        self._pec_enabled = False
+        # last temperature read and the time.monotonic() it was read at.
+        self._temp_cache = (0.0, float('-inf'))
+        # the sensor keeps its config across restarts, so the conversion
+        # rate is unknown until the config is read or written.
+        # read the sensor on every call until then.
+        self._refresh_period = 0
+        # refresh period set through refresh_rate, None to follow conversionRate.
+        self._refresh_override = None
 
-    @faultQueue.setter
-    def faultQueue(self, fq):
+    @property
+    def PEC(self):
         """
-        set the fault queue settings.
-        0: 1 fault
-        1: 2 faults
-        2: 4 faults
-        3: 6 faults
+        return current packet error checking (PEC) setting
+        0: PEC is disabled
+        1: PEC is enabled
         """
-        if fq not in (0, 1, 2, 3):
-            raise ValueError("Invalid fault queue")
-        self.configBuf[0] = (self.configBuf[0] & 0xE7) | (fq << 3)
+        return self._read_field(*self._FIELDS['PEC'])
 
-    @property
-    def shutDown(self):
+    @PEC.setter
+    def PEC(self, PEC):
         """
-        return the current shutdown mode setting
-        shutdown mode reduce supply current to 1uA or less. 
-        continuous temperature conversion is stopped.
-        0: continuous conversion mode
-        1: shut down mode
+        set the packet error checking (PEC) setting
+        0: PEC is disabled
+        1: PEC is enabled
         """
-        return self.config[0] & 1
+        spec = self._FIELD_SPECS['PEC']
+        _packField(self.configBuf, 'PEC', spec, PEC)
+        if PEC:
+            # if enabling PEC, then set the current config state to PEC enabled.
+            # otherwise, the config write will fail.
+            _packField(self.config, 'PEC', spec, PEC)
+        self._pec_enabled = bool(self.PEC)
 
-    @shutDown.setter
-    def shutDown(self, sd):
+    def _read_field(self, byte_idx, shift, mask):
         """
-        set the shutdown mode.
-        0: continuous conversion mode
-        1: shut down mode
+        return a configuration field from the current config
         """
-        if sd not in (0, 1):
-            raise ValueError("Invalid shut down mode setting")
-        self.configBuf[0] = (self.configBuf[0] & 0xFE) | (sd)
+        return (self.config[byte_idx] >> shift) & mask
 
-    @property
-    def compInt(self):
+    def _setConfigBuf(self, **settings):
         """
-        return the current comparator interrupt setting.
-        the mode determine the behavior of overtemperature status bit operation.
-        0: comparator mode
-        1: interrupt mode
+        validate the given settings and pack them into configBuf,
+        used by configure.
+        settings passed as _KEEP are left unchanged.
+        configBuf is not changed if any setting is invalid.
         """
-        return (self.config[0] >> 1) & 1
+        buf = bytearray(self.configBuf)
+        for name, value in settings.items():
+            if value is not _KEEP:
+                _packField(buf, name, self._FIELD_SPECS[name], value)
+        self.configBuf[:] = buf
 
-    @compInt.setter
-    def compInt(self, c):
+    def configure(self, *, format=_KEEP, PEC=_KEEP, resolution=_KEEP,
+                  conversionRate=_KEEP, timeOut=_KEEP, faultQueue=_KEEP,
+                  shutDown=_KEEP, compInt=_KEEP):
         """
-        set the comparator interrupt.
-        0: comparator mode
-        1: interrupt mode
+        set several configurations and write them to the sensor
+        in a single transaction.
+        arguments are named after the configuration properties,
+        settings not given are kept unchanged.
         """
-        if c not in (0, 1):
-            raise ValueError("Invalid shut down mode setting")
-        self.configBuf[0] = (self.configBuf[0] & 0xFD) | (c << 1)
+        self._setConfigBuf(format=format, PEC=PEC, resolution=resolution,
+                           conversionRate=conversionRate, timeOut=timeOut,
+                           faultQueue=faultQueue, shutDown=shutDown,
+                           compInt=compInt)
+        if PEC is not _KEEP and PEC:
+            # same as the PEC setter, the config write must carry a CRC.
+            _packField(self.config, 'PEC', self._FIELD_SPECS['PEC'], PEC)
+            self._pec_enabled = True
+        self.writeConfig()
 
     @property
     def configBits(self):
@@ -224,7 +259,7 @@ class MAX31875:
         """
         buf = self.read(1, 2)
         if buf:
-            self.config = buf
+            self._setConfig(buf)
         else:
             raise IOError("Failed to read configuration")
 
@@ -232,8 +267,54 @@ class MAX31875:
         """
         write the config buf to config register
         """
-        self.write(1, self.configBuf)
-        self.config = self.configBuf
+        self.write(1, list(self.configBuf))
+        self._setConfig(self.configBuf)
+
+    def _setConfig(self, buf):
+        """
+        store buf as the current config and update the state derived from it
+        """
+        old = (self.format, self.resolution)
+        # copy, so later changes to configBuf are not reported as current.
+        self.config = bytearray(buf)
+        self._pec_enabled = bool(self.PEC)
+        if self._refresh_override is None:
+            self._refresh_period = self._REFRESH_PERIODS[self.conversionRate]
+        else:
+            self._refresh_period = self._refresh_override
+        if (self.format, self.resolution) != old:
+            # the cached temperature was decoded with the old settings.
+            self._temp_cache = (0.0, float('-inf'))
+
+    @property
+    def refresh_rate(self):
+        """
+        return how many times per second getTemperature reads the sensor.
+        faster calls return the last temperature read.
+        follows conversionRate once the config is read or written,
+        unless set explicitly.
+        """
+        if self._refresh_period:
+            return 1 / self._refresh_period
+        return float('inf')
+
+    @refresh_rate.setter
+    def refresh_rate(self, rate):
+        """
+        override the refresh rate, in reads per second.
+        set to float('inf') to read the sensor on every getTemperature call.
+        set to None to follow conversionRate again, from the next
+        readConfig, writeConfig or readAll; the sensor is read on every
+        call until then.
+        """
+        if rate is None:
+            self._refresh_override = None
+            self._refresh_period = 0
+        elif rate > 0:
+            self._refresh_override = 1 / rate
+            self._refresh_period = self._refresh_override
+        else:
+            raise ValueError("Invalid refresh rate")
 
     @property
     def T_hyst(self):
@@ -278,11 +359,12 @@ class MAX31875:
         convert temperature to upper and lower byte
         """
         p = 3 if self.format else 4
-        d = int(abs(t) * 16)
-        u = d >> (8-p) & 0x7F
+        # temperature in units of the 0.0625 C LSB
+        d = int(round(t * 16))
+        neg = d < 0
+        d = -d if neg else d
+        u = (d >> (8-p) & 0x7F) | (neg << 7)
         l = d << p & 0xFF
-        if t < 0:
-            u |= 0x80
         return u, l
 
     def byteToTemp(self, u, l):
@@ -290,28 +372,117 @@ class MAX31875:
         calculate temperature from 2 data bytes
         """
         p = 3 if self.format else 4
-        t = (((u & 0x7F) << (8-p)) + (l >> p)) * 0.0625
-        return -t if (u & 0x80) else t
+        raw = ((u & 0x7F) << (8-p)) | (l >> p)
+        return (-raw if (u & 0x80) else raw) / 16.0
 
     def getTemperature(self):
         "read current temperature"
+        value, ts = self._temp_cache
+        if time.monotonic() - ts < self._refresh_period:
+            return value
+        return self._readTemperature()
+
+    def _readTemperature(self):
+        """
+        read the temperature register and update the cached temperature
+        """
         # read upper and lower temperature bytes, c is the optional correction byte
         # TODO: add support for the correction byte
         t = self.read(0, 2)
         if t:
-            return self.byteToTemp(*t)
+            value = self.byteToTemp(*t)
+            self._temp_cache = (value, time.monotonic())
+            return value
         else:
             raise IOError("Failed to read temperature")
 
+    def _startOneShot(self):
+        """
+        put the sensor in shutdown mode and start a one-shot conversion.
+        """
+        if not self.shutDown:
+            # write only the shutdown bit on top of the current config,
+            # settings staged in configBuf are not written as a side effect.
+            self.write(1, [self.config[0] | self._SHUTDOWN, self.config[1]])
+            self.config[0] |= self._SHUTDOWN
+            self.configBuf[0] |= self._SHUTDOWN
+        self.write(1, [self.config[0] | self._ONESHOT, self.config[1]])
+
+    def _waitOneShot(self, deadline):
+        """
+        poll the config register until the one-shot conversion is done.
+        deadline: time.monotonic() value to give up at.
+        """
+        while True:
+            buf = self.read(1, 2)
+            if buf and not (buf[0] & self._ONESHOT):
+                return
+            if time.monotonic() > deadline:
+                raise IOError("One-shot conversion timed out")
+            time.sleep(self._ONESHOT_POLL)
+
+    def getTemperatureOneShot(self):
+        """
+        put the sensor in shutdown mode, run a single conversion and
+        return the temperature.
+        the sensor stays in shutdown mode afterwards.
+        """
+        self._startOneShot()
+        self._waitOneShot(time.monotonic() + self._ONESHOT_TIMEOUT)
+        return self._readTemperature()
+
+    @classmethod
+    def poll_all(cls, sensors):
+        """
+        run a one-shot conversion on all sensors and return their
+        temperatures in the same order.
+        conversions are started on every sensor before any is read,
+        so they run concurrently instead of one after another.
+        the sensors stay in shutdown mode afterwards.
+        """
+        sensors = list(sensors)
+        for s in sensors:
+            s._startOneShot()
+        # one deadline for the batch, the conversions run together.
+        deadline = time.monotonic() + cls._ONESHOT_TIMEOUT
+        temps = []
+        for s in sensors:
+            s._waitOneShot(deadline)
+            temps.append(s._readTemperature())
+        return temps
+
+    def readAll(self):
+        """
+        read temperature, configuration, T_hyst and T_os in one transaction.
+        the registers are contiguous, so a single 8-byte read from register 0
+        returns all of them. self.config is updated with the configuration read.
+        return a dict with keys 'temp', 'config', 't_hyst' and 't_os'.
+        """
+        data = self.read(0, 8)
+        if not data:
+            raise IOError("Failed to read registers")
+        # update config first, the temperature format depends on it.
+        self._setConfig(data[2:4])
+        temp = self.byteToTemp(data[0], data[1])
+        self._temp_cache = (temp, time.monotonic())
+        return {
+            'temp': temp,
+            'config': data[2:4],
+            't_hyst': self.byteToTemp(data[4], data[5]),
+            't_os': self.byteToTemp(data[6], data[7]),
+        }
+
     def write(self, register, data):
         """
         write bytes to register using I2C
         if PEC is enabled, add the CRC-8 byte at then end of data
         """
         addr = self.addr
-        if self.PEC:
-            crc = self.calcCRC([addr << 1, register] + data)
-            self.bus.write_i2c_block_data(addr, register, data+[crc])
+        if self._pec_enabled:
+            payload = bytearray((self._addr_w, register))
+            payload.extend(data)
+            crc = self.calcCRC(payload)
+            self.bus.write_i2c_block_data(addr, register, list(data) + [crc])
         else:
             self.bus.write_i2c_block_data(addr, register, data)
 
@@ -323,25 +494,28 @@ class MAX31875:
         if crc is incorrect, return None
         """
         addr = self.addr
-        if self.PEC:
-            data = self.bus.read_i2c_block_data(addr, register, length+1)
-            tocheck = [addr << 1, register, (addr << 1)+1] + data[:-1]
+        # write the register pointer then read with a repeated start,
+        # so the whole read is a single I2C transaction.
+        w = i2c_msg.write(addr, [register])
+        r = i2c_msg.read(addr, length + (1 if self._pec_enabled else 0))
+        self.bus.i2c_rdwr(w, r)
+        data = bytes(r)
+        if self._pec_enabled:
+            tocheck = bytearray((self._addr_w, register, self._addr_r))
+            tocheck += data[:-1]
             if self.checkCRC(tocheck, data[-1]):
-                return data[:-1]
+                return list(data[:-1])
             else:
                 return None
         else:
-            return self.bus.read_i2c_block_data(addr, register, length)
+            return list(data)
 
     def calcCRC(self, data):
         """
         calculate the crc-8 byte from data
+        data: bytes or bytearray
         """
-        table = b'\x00\x07\x0e\t\x1c\x1b\x12\x158?61$#*-pw~ylkbeHOFATSZ]\xe0\xe7\xee\xe9\xfc\xfb\xf2\xf5\xd8\xdf\xd6\xd1\xc4\xc3\xca\xcd\x90\x97\x9e\x99\x8c\x8b\x82\x85\xa8\xaf\xa6\xa1\xb4\xb3\xba\xbd\xc7\xc0\xc9\xce\xdb\xdc\xd5\xd2\xff\xf8\xf1\xf6\xe3\xe4\xed\xea\xb7\xb0\xb9\xbe\xab\xac\xa5\xa2\x8f\x88\x81\x86\x93\x94\x9d\x9a\' ).;<52\x1f\x18\x11\x16\x03\x04\r\nWPY^KLEBohafst}z\x89\x8e\x87\x80\x95\x92\x9b\x9c\xb1\xb6\xbf\xb8\xad\xaa\xa3\xa4\xf9\xfe\xf7\xf0\xe5\xe2\xeb\xec\xc1\xc6\xcf\xc8\xdd\xda\xd3\xd4ing`ur{|QV_XMJCD\x19\x1e\x17\x10\x05\x02\x0b\x0c!&/(=:34NI@GRU\\[vqx\x7fjmdc>907"%,+\x06\x01\x08\x0f\x1a\x1d\x14\x13\xae\xa9\xa0\xa7\xb2\xb5\xbc\xbb\x96\x91\x98\x9f\x8a\x8d\x84\x83\xde\xd9\xd0\xd7\xc2\xc5\xcc\xcb\xe6\xe1\xe8\xef\xfa\xfd\xf4\xf3'
-        _sum = 0
-        for byte in data:
-            _sum = table[_sum ^ byte]
-        return _sum
+        return _crc8(bytes(data))
 
     def checkCRC(self, data, byte):
         """